@@ -4,130 +4,388 @@ Job Board Web Application
 Simple Flask app to view and track job applications
 """
 
-from flask import Flask, render_template, jsonify, request
-import json
+from flask import Flask, render_template, jsonify, request, g
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import os
 from datetime import datetime, timedelta
 import sqlite3
 import threading
-import math
+import queue
+import time
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import islice
 
 from config import (
-    DATA_DIR, DB_PATH, JOBS_FILE, DISCOVERED_FILE,
+    DATA_DIR, DB_PATH, JOBS_FILE, DISCOVERED_FILE, DISCOVERED_COUNTS_FILE,
     load_keywords, save_keywords, load_locations, save_locations,
-    load_json_file, ensure_data_dir, matches_location_word_boundary
+    load_json_file_cached, ensure_data_dir, compile_location_pattern
 )
 from scraper import run_scraper as scraper_run
 from discovery import run_discovery as discovery_run
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses and decodes requests with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError('jsonify() behavior undefined when passed both args and kwargs')
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        return self._app.response_class(self._encode(obj), mimetype=self.mimetype)
+
+    def _encode(self, obj) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Track scraper status
 scraper_status = {'running': False, 'last_run': None, 'message': ''}
 
+# Background scrape and discovery threads; at most one of each runs at a time.
+# They are daemon threads so stopping the server doesn't wait for a run to finish.
+_scraper_thread = None
+_discovery_thread = None
+_task_lock = threading.Lock()
+
+# Page sizes offered by the UI
+PER_PAGE_OPTIONS = frozenset({10, 20, 50, 100})
+
+# Work type patterns, matched as plain substrings of the job text
+REMOTE_PATTERN = re.compile(r'remote|work from home|wfh|anywhere|distributed')
+ONSITE_PATTERN = re.compile(r'on-site|onsite|in-office|in office')
+
+# Company stats for the cached discovered companies: (data, stats)
+_company_stats = (None, None)
+
+# Column view of the cached jobs list: (jobs, allowed terms, view)
+_jobs_view = (None, None, None)
+# Jobs list whose lowercased text fields have been precomputed, its sorted
+# sources, and id(job) -> (location text, search text). The cached job dicts
+# are read-only, so the derived text lives here; holding the list keeps the
+# ids valid.
+_indexed_jobs = (None, (), {})
+
+# Date filter cutoffs, recomputed at most once a minute: (monotonic time, cutoffs)
+DATE_CUTOFFS_TTL = 60
+_date_cutoffs = (None, None)
+
+# Write statements for the application tracking tables
+APPLY_SQL = '''
+    INSERT OR REPLACE INTO applications (job_url, applied_date, notes, status)
+    VALUES (?, ?, ?, ?)
+'''
+UNAPPLY_SQL = 'DELETE FROM applications WHERE job_url = ?'
+HIDE_SQL = 'INSERT OR IGNORE INTO hidden_jobs (job_url, hidden_date) VALUES (?, ?)'
+UNHIDE_SQL = 'DELETE FROM hidden_jobs WHERE job_url = ?'
+
+# Idle SQLite connections shared by all request threads. The dev server
+# starts a thread per request, so each request checks a connection out and
+# returns it at teardown; connections beyond the pool size are closed.
+DB_POOL_SIZE = 4
+_db_pool = queue.Queue(maxsize=DB_POOL_SIZE)
+
+
+def _file_mtime(path):
+    """Get a file's mtime in nanoseconds, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
 def get_company_stats():
-    """Get statistics about discovered companies"""
-    data = load_json_file(DISCOVERED_FILE, {})
+    """Get statistics about discovered companies (recomputed when the file changes)"""
+    global _company_stats
+
+    # Discovery writes a counts sidecar; use it unless the full list is newer
+    counts_mtime = _file_mtime(DISCOVERED_COUNTS_FILE)
+    discovered_mtime = _file_mtime(DISCOVERED_FILE)
+    if counts_mtime is not None and discovered_mtime is not None and counts_mtime >= discovered_mtime:
+        counts = load_json_file_cached(DISCOVERED_COUNTS_FILE)
+        if counts:
+            return counts
+
+    data = load_json_file_cached(DISCOVERED_FILE, {})
+    cached_data, stats = _company_stats
+    if cached_data is data:
+        return stats
+
     ats_keys = ['greenhouse', 'lever', 'ashby', 'smartrecruiters', 'bamboohr']
     stats = {key: len(data.get(key, {})) for key in ats_keys}
     stats['total'] = sum(stats.values())
     stats['last_updated'] = data.get('last_updated')
+    _company_stats = (data, stats)
     return stats
 
 
+def get_search_text(job):
+    """Get the lowercased location, title and description of a job"""
+    texts = _indexed_jobs[2].get(id(job))
+    if texts is not None:
+        return texts[1]
+    return f"{job.get('location', '')} {job.get('title', '')} {job.get('description', '')}".lower()
+
+
+def get_location_text(job):
+    """Get the lowercased location and title of a job"""
+    texts = _indexed_jobs[2].get(id(job))
+    if texts is not None:
+        return texts[0]
+    return f"{job.get('location', '')} {job.get('title', '')}".lower()
+
+
 def detect_work_type(job):
     """Detect if job is Remote, Hybrid, or On-site"""
-    location = job.get('location', '').lower()
-    title = job.get('title', '').lower()
-    description = job.get('description', '').lower()
+    return _detect_work_type(get_search_text(job), bool(job.get('remote', False)))
+
 
-    text = f"{location} {title} {description}"
+@lru_cache(maxsize=20000)
+def _detect_work_type(text, remote):
+    """Memoized work type detection from a job's lowercased text"""
+    hybrid = 'hybrid' in text
 
-    if any(term in text for term in ['remote', 'work from home', 'wfh', 'anywhere', 'distributed']):
-        if 'hybrid' in text:
+    if REMOTE_PATTERN.search(text):
+        if hybrid:
             return 'Hybrid'
         return 'Remote'
-    elif 'hybrid' in text:
+    elif hybrid:
         return 'Hybrid'
-    elif any(term in text for term in ['on-site', 'onsite', 'in-office', 'in office']):
+    elif ONSITE_PATTERN.search(text):
         return 'On-site'
 
     # Check if remote flag is set
-    if job.get('remote', False):
+    if remote:
         return 'Remote'
 
     return None  # Unknown
 
 
-def is_job_in_allowed_location(job, locations=None):
-    """Check if job location matches allowed locations (word boundary matching)"""
+def is_remote_allowed(locations):
+    """Check if 'remote' is one of the allowed location terms"""
+    return any(t.lower() == 'remote' for t in locations.get('allowed', []))
+
+
+def is_job_in_allowed_location(job, locations=None, remote_allowed=None, pattern=None):
+    """
+    Check if job location matches allowed locations (word boundary matching).
+    Pass remote_allowed and the compiled pattern when checking many jobs
+    against the same locations.
+    """
     if locations is None:
         locations = load_locations()
 
-    location = job.get('location', '')
-    title = job.get('title', '')
-    text = f"{location} {title}"
-    allowed = locations.get('allowed', [])
-
-    if matches_location_word_boundary(text, allowed):
+    if pattern is None:
+        pattern = compile_location_pattern(tuple(locations.get('allowed', [])))
+    if pattern.search(get_location_text(job)):
         return True
 
     # If job is marked as remote and remote is in allowed list
-    if job.get('remote', False) and 'remote' in [t.lower() for t in allowed]:
-        return True
+    if job.get('remote', False):
+        if remote_allowed is None:
+            remote_allowed = is_remote_allowed(locations)
+        return remote_allowed
 
     return False
 
 
+def _connect():
+    """Open a SQLite connection that can be handed between request threads"""
+    ensure_data_dir()
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA busy_timeout=5000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    # Up to ~20 MB of page cache, allocated as pages are read; pooled
+    # connections keep it warm from one request to the next
+    conn.execute('PRAGMA cache_size=-20000')
+    return conn
+
+
+def _get_conn():
+    """Get this app context's SQLite connection, checking one out of the pool on first use"""
+    if 'db' not in g:
+        try:
+            g.db = _db_pool.get_nowait()
+        except queue.Empty:
+            g.db = _connect()
+    return g.db
+
+
+@app.teardown_appcontext
+def _release_conn(exc):
+    """Return the app context's SQLite connection to the pool, or close it if the pool is full"""
+    conn = g.pop('db', None)
+    if conn is None:
+        return
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
 def init_db():
     """Initialize SQLite database for tracking applications"""
-    ensure_data_dir()
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_url TEXT UNIQUE,
-            applied_date TEXT,
-            notes TEXT,
-            status TEXT DEFAULT 'applied'
-        )
-    ''')
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS hidden_jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_url TEXT UNIQUE,
-            hidden_date TEXT
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    conn = _get_conn()
+    with conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS applications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_url TEXT UNIQUE,
+                applied_date TEXT,
+                notes TEXT,
+                status TEXT DEFAULT 'applied'
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS hidden_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_url TEXT UNIQUE,
+                hidden_date TEXT
+            )
+        ''')
+        # Lets the per-page applied lookup be answered from the index alone;
+        # hidden_jobs lookups are already covered by its UNIQUE index
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_applications_covering
+            ON applications (job_url, applied_date, notes, status)
+        ''')
+
+
+def execute_writes(sql, rows):
+    """Run a write statement once per params tuple, all in a single transaction"""
+    with _get_conn() as conn:
+        conn.executemany(sql, rows)
 
 
 def get_applied_jobs():
     """Get all applied job URLs"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('SELECT job_url, applied_date, notes, status FROM applications')
-    applied = {row[0]: {'date': row[1], 'notes': row[2], 'status': row[3]} for row in c.fetchall()}
-    conn.close()
-    return applied
+    c = _get_conn().execute('SELECT job_url, applied_date, notes, status FROM applications')
+    return {row[0]: {'date': row[1], 'notes': row[2], 'status': row[3]} for row in c.fetchall()}
 
 
 def get_hidden_jobs():
     """Get all hidden job URLs"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('SELECT job_url FROM hidden_jobs')
-    hidden = set(row[0] for row in c.fetchall())
-    conn.close()
-    return hidden
+    c = _get_conn().execute('SELECT job_url FROM hidden_jobs')
+    return set(row[0] for row in c.fetchall())
+
+
+def get_tracking_for_urls(urls):
+    """Get (applied info, hidden URLs) for the given job URLs in a single query"""
+    applied, hidden = {}, set()
+    if not urls:
+        return applied, hidden
+
+    placeholders = ','.join('?' * len(urls))
+    c = _get_conn().execute(f'''
+        SELECT 'a', job_url, applied_date, notes, status FROM applications
+        WHERE job_url IN ({placeholders})
+        UNION ALL
+        SELECT 'h', job_url, NULL, NULL, NULL FROM hidden_jobs
+        WHERE job_url IN ({placeholders})
+    ''', list(urls) * 2)
+    for kind, url, applied_date, notes, status in c.fetchall():
+        if kind == 'a':
+            applied[url] = {'date': applied_date, 'notes': notes, 'status': status}
+        else:
+            hidden.add(url)
+    return applied, hidden
+
+
+def get_tracking_counts():
+    """Get the number of applied and hidden jobs in a single query"""
+    c = _get_conn().execute(
+        'SELECT (SELECT COUNT(*) FROM applications), (SELECT COUNT(*) FROM hidden_jobs)'
+    )
+    return c.fetchone()
 
 
 def load_jobs():
-    """Load jobs from JSON file"""
-    return load_json_file(JOBS_FILE, [])
+    """Load jobs from JSON file (cached until the scraper rewrites it)"""
+    global _indexed_jobs
+    jobs = load_json_file_cached(JOBS_FILE, [])
+    if jobs is not _indexed_jobs[0]:
+        # Lowercase the matched text fields once per load, not per request
+        sources = set()
+        texts = {}
+        for job in jobs:
+            location_text = f"{job.get('location', '')} {job.get('title', '')}".lower()
+            texts[id(job)] = (location_text, f"{location_text} {job.get('description', '').lower()}")
+            sources.add(job.get('source', 'Unknown'))
+        _indexed_jobs = (jobs, tuple(sorted(sources)), texts)
+    return jobs
+
+
+def get_job_sources():
+    """Get the sorted sources of the most recently loaded jobs"""
+    return _indexed_jobs[1]
+
+
+def get_jobs_view(jobs, locations):
+    """
+    Get the jobs in allowed locations as parallel columns, newest first.
+    Rebuilt only when the cached jobs list or the allowed locations change.
+    """
+    global _jobs_view
+    allowed = tuple(locations.get('allowed', []))
+    cached_jobs, cached_allowed, view = _jobs_view
+    if cached_jobs is jobs and cached_allowed == allowed:
+        return view
+
+    # Work types memoized for the previous jobs file are no longer needed
+    if cached_jobs is not jobs:
+        _detect_work_type.cache_clear()
+
+    remote_allowed = is_remote_allowed(locations)
+    pattern = compile_location_pattern(allowed)
+    matching = [job for job in jobs
+                if is_job_in_allowed_location(job, locations, remote_allowed, pattern)]
+    dates = [job.get('date_scraped', '') for job in matching]
+    order = sorted(range(len(matching)), key=dates.__getitem__, reverse=True)
+    matching = [matching[i] for i in order]
+    view = {
+        'jobs': matching,
+        'urls': [job.get('url', '') for job in matching],
+        'sources': [job.get('source', '') for job in matching],
+        'dates': [job.get('date_scraped', '') for job in matching],
+    }
+    _jobs_view = (jobs, allowed, view)
+    return view
+
+
+def get_date_cutoffs():
+    """Get the ISO timestamp cutoff for each date filter (cached for a minute)"""
+    global _date_cutoffs
+    computed_at, cutoffs = _date_cutoffs
+    now_ts = time.monotonic()
+    if computed_at is not None and now_ts - computed_at < DATE_CUTOFFS_TTL:
+        return cutoffs
+
+    now = datetime.now()
+    cutoffs = {
+        'today': now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(),
+        '3days': (now - timedelta(days=3)).isoformat(),
+        '7days': (now - timedelta(days=7)).isoformat(),
+        '30days': (now - timedelta(days=30)).isoformat(),
+    }
+    _date_cutoffs = (now_ts, cutoffs)
+    return cutoffs
 
 
 def run_scraper():
@@ -159,8 +417,6 @@ def run_scraper():
 def index():
     """Main page - show all jobs"""
     jobs = load_jobs()
-    applied = get_applied_jobs()
-    hidden = get_hidden_jobs()
     keywords = load_keywords()
     locations = load_locations()
 
@@ -172,67 +428,80 @@ def index():
     page = int(request.args.get('page', '1'))
 
     # Validate per_page
-    if per_page not in [10, 20, 50, 100]:
+    if per_page not in PER_PAGE_OPTIONS:
         per_page = 20
 
-    enriched_jobs = []
-    sources = set()
-
-    # Calculate date cutoffs
-    now = datetime.now()
-    date_cutoffs = {
-        'today': now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(),
-        '3days': (now - timedelta(days=3)).isoformat(),
-        '7days': (now - timedelta(days=7)).isoformat(),
-        '30days': (now - timedelta(days=30)).isoformat(),
-    }
-
-    for job in jobs:
-        url = job.get('url', '')
-        sources.add(job.get('source', 'Unknown'))
-
-        # Filter to allowed locations
-        if not is_job_in_allowed_location(job, locations):
-            continue
-
-        if url in hidden and not show_hidden:
-            continue
-
-        if filter_source and job.get('source', '') != filter_source:
-            continue
-
-        # Date filtering
-        if filter_date and filter_date in date_cutoffs:
-            job_date = job.get('date_scraped', '')
-            if job_date < date_cutoffs[filter_date]:
-                continue
-
-        job['applied'] = url in applied
-        job['applied_info'] = applied.get(url, {})
-        job['hidden'] = url in hidden
-        job['work_type'] = detect_work_type(job)
-
-        if filter_status == 'applied' and not job['applied']:
-            continue
-        if filter_status == 'not_applied' and job['applied']:
-            continue
-
-        enriched_jobs.append(job)
-
-    enriched_jobs.sort(key=lambda x: x.get('date_scraped', ''), reverse=True)
+    view = get_jobs_view(jobs, locations)
+
+    # Full URL sets are only loaded when they drive filtering
+    hidden = get_hidden_jobs() if not show_hidden else set()
+    applied_urls = get_applied_jobs() if filter_status in ('applied', 'not_applied') else {}
+
+    date_cutoff = get_date_cutoffs().get(filter_date)
+
+    # Dates are sorted newest first, so the date filter keeps a prefix
+    # of the view; binary search for where it ends
+    date_limit = len(view['dates'])
+    if date_cutoff:
+        date_limit = bisect_left(view['dates'], True, key=date_cutoff.__gt__)
+
+    # Filter pipeline over the view, which already excludes disallowed
+    # locations and is sorted by date: only active filters add a stage
+    rows = islice(zip(view['jobs'], view['urls'], view['sources']), date_limit)
+    filtered = False
+    if hidden:
+        rows = (row for row in rows if row[1] not in hidden)
+        filtered = True
+    if filter_source:
+        rows = (row for row in rows if row[2] == filter_source)
+        filtered = True
+    if filter_status == 'applied':
+        rows = (row for row in rows if row[1] in applied_urls)
+        filtered = True
+    elif filter_status == 'not_applied':
+        rows = (row for row in rows if row[1] not in applied_urls)
+        filtered = True
+
+    # Without filter stages the date prefix is the result, so its length is
+    # the total and the page can be sliced straight out of the view
+    if filtered:
+        matches = list(rows)
+        total_jobs = len(matches)
+    else:
+        total_jobs = date_limit
 
     # Pagination
-    total_jobs = len(enriched_jobs)
-    total_pages = math.ceil(total_jobs / per_page) if total_jobs > 0 else 1
+    total_pages = max(1, -(-total_jobs // per_page))
     page = max(1, min(page, total_pages))  # Clamp page to valid range
     start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
-    paginated_jobs = enriched_jobs[start_idx:end_idx]
 
+    # Only the visible page gets copied and enriched
+    if filtered:
+        page_matches = matches[start_idx:end_idx]
+    else:
+        page_matches = list(islice(rows, start_idx, end_idx))
+    page_urls = [url for _, url, _ in page_matches]
+    applied, page_hidden = get_tracking_for_urls(page_urls)
+
+    paginated_jobs = []
+    for job, url, _ in page_matches:
+        # Detect on the cached job, whose lowercased text is precomputed
+        work_type = detect_work_type(job)
+        # Copy so per-request fields don't leak into the cached job list
+        job = dict(job)
+        applied_info = applied.get(url)
+        job['applied'] = applied_info is not None
+        job['applied_info'] = applied_info or {}
+        job['hidden'] = url in page_hidden
+        job['work_type'] = work_type
+        paginated_jobs.append(job)
+
+    applied_count, hidden_count = get_tracking_counts()
     stats = {
         'total': len(jobs),
-        'applied': len(applied),
-        'hidden': len(hidden),
+        'applied': applied_count,
+        'hidden': hidden_count,
         'visible': total_jobs
     }
 
@@ -249,7 +518,7 @@ def index():
 
     return render_template('index.html',
                          jobs=paginated_jobs,
-                         sources=sorted(sources),
+                         sources=get_job_sources(),
                          stats=stats,
                          filter_source=filter_source,
                          filter_status=filter_status,
@@ -265,14 +534,13 @@ def index():
 @app.route('/api/scrape', methods=['POST'])
 def start_scrape():
     """Start a new job scrape"""
-    global scraper_status
-
-    if scraper_status['running']:
-        return jsonify({'error': 'Scraper already running'}), 400
+    global _scraper_thread
 
-    thread = threading.Thread(target=run_scraper)
-    thread.daemon = True
-    thread.start()
+    with _task_lock:
+        if _scraper_thread and _scraper_thread.is_alive():
+            return jsonify({'error': 'Scraper already running'}), 400
+        _scraper_thread = threading.Thread(target=run_scraper, name='scraper', daemon=True)
+        _scraper_thread.start()
 
     return jsonify({'success': True, 'message': 'Scrape started'})
 
@@ -288,23 +556,12 @@ def mark_applied():
     """Mark a job as applied"""
     data = request.json
     job_url = data.get('url')
-    notes = data.get('notes', '')
-    status = data.get('status', 'applied')
 
     if not job_url:
         return jsonify({'error': 'URL required'}), 400
 
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    try:
-        c.execute('''
-            INSERT OR REPLACE INTO applications (job_url, applied_date, notes, status)
-            VALUES (?, ?, ?, ?)
-        ''', (job_url, datetime.now().isoformat(), notes, status))
-        conn.commit()
-        return jsonify({'success': True})
-    finally:
-        conn.close()
+    apply_jobs([data])
+    return jsonify({'success': True})
 
 
 @app.route('/api/unapply', methods=['POST'])
@@ -316,14 +573,8 @@ def unmark_applied():
     if not job_url:
         return jsonify({'error': 'URL required'}), 400
 
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    try:
-        c.execute('DELETE FROM applications WHERE job_url = ?', (job_url,))
-        conn.commit()
-        return jsonify({'success': True})
-    finally:
-        conn.close()
+    execute_writes(UNAPPLY_SQL, [(job_url,)])
+    return jsonify({'success': True})
 
 
 @app.route('/api/hide', methods=['POST'])
@@ -335,15 +586,8 @@ def hide_job():
     if not job_url:
         return jsonify({'error': 'URL required'}), 400
 
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    try:
-        c.execute('INSERT OR IGNORE INTO hidden_jobs (job_url, hidden_date) VALUES (?, ?)',
-                  (job_url, datetime.now().isoformat()))
-        conn.commit()
-        return jsonify({'success': True})
-    finally:
-        conn.close()
+    hide_jobs([job_url])
+    return jsonify({'success': True})
 
 
 @app.route('/api/unhide', methods=['POST'])
@@ -355,14 +599,95 @@ def unhide_job():
     if not job_url:
         return jsonify({'error': 'URL required'}), 400
 
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    try:
-        c.execute('DELETE FROM hidden_jobs WHERE job_url = ?', (job_url,))
-        conn.commit()
-        return jsonify({'success': True})
-    finally:
-        conn.close()
+    execute_writes(UNHIDE_SQL, [(job_url,)])
+    return jsonify({'success': True})
+
+
+def apply_jobs(items):
+    """Mark jobs as applied; each item is a dict with a url and optional notes/status"""
+    now = datetime.now().isoformat()
+    execute_writes(APPLY_SQL, [
+        (item['url'], now, item.get('notes', ''), item.get('status', 'applied'))
+        for item in items
+    ])
+
+
+def hide_jobs(urls):
+    """Hide jobs by URL"""
+    now = datetime.now().isoformat()
+    execute_writes(HIDE_SQL, [(url, now) for url in urls])
+
+
+def get_batch_urls(data):
+    """Get the 'urls' list from a batch request body, or None if it's invalid"""
+    urls = data.get('urls') if isinstance(data, dict) else None
+    if not isinstance(urls, list) or not all(url and isinstance(url, str) for url in urls):
+        return None
+    return urls
+
+
+def get_batch_items(data):
+    """Get the 'items' list from a batch apply request body, or None if it's invalid"""
+    items = data.get('items') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not all(is_valid_apply_item(item) for item in items):
+        return None
+    return items
+
+
+def is_valid_apply_item(item):
+    """Check a batch apply item has a string URL and, if given, string notes and status"""
+    return (isinstance(item, dict)
+            and bool(item.get('url')) and isinstance(item['url'], str)
+            and isinstance(item.get('notes', ''), str)
+            and isinstance(item.get('status', ''), str))
+
+
+@app.route('/api/apply_batch', methods=['POST'])
+def mark_applied_batch():
+    """Mark several jobs as applied in one transaction"""
+    items = get_batch_items(request.json)
+
+    if items is None:
+        return jsonify({'error': 'Items must be a list of objects with a URL and string notes/status'}), 400
+
+    apply_jobs(items)
+    return jsonify({'success': True, 'count': len(items)})
+
+
+@app.route('/api/unapply_batch', methods=['POST'])
+def unmark_applied_batch():
+    """Remove applied status from several jobs in one transaction"""
+    urls = get_batch_urls(request.json)
+
+    if urls is None:
+        return jsonify({'error': 'URLs must be a list of non-empty strings'}), 400
+
+    execute_writes(UNAPPLY_SQL, [(url,) for url in urls])
+    return jsonify({'success': True, 'count': len(urls)})
+
+
+@app.route('/api/hide_batch', methods=['POST'])
+def hide_job_batch():
+    """Hide several jobs in one transaction"""
+    urls = get_batch_urls(request.json)
+
+    if urls is None:
+        return jsonify({'error': 'URLs must be a list of non-empty strings'}), 400
+
+    hide_jobs(urls)
+    return jsonify({'success': True, 'count': len(urls)})
+
+
+@app.route('/api/unhide_batch', methods=['POST'])
+def unhide_job_batch():
+    """Unhide several jobs in one transaction"""
+    urls = get_batch_urls(request.json)
+
+    if urls is None:
+        return jsonify({'error': 'URLs must be a list of non-empty strings'}), 400
+
+    execute_writes(UNHIDE_SQL, [(url,) for url in urls])
+    return jsonify({'success': True, 'count': len(urls)})
 
 
 @app.route('/api/keywords', methods=['GET'])
@@ -442,14 +767,13 @@ def run_discovery():
 @app.route('/api/discover', methods=['POST'])
 def start_discovery():
     """Start company discovery"""
-    global discovery_status
+    global _discovery_thread
 
-    if discovery_status['running']:
-        return jsonify({'error': 'Discovery already running'}), 400
-
-    thread = threading.Thread(target=run_discovery)
-    thread.daemon = True
-    thread.start()
+    with _task_lock:
+        if _discovery_thread and _discovery_thread.is_alive():
+            return jsonify({'error': 'Discovery already running'}), 400
+        _discovery_thread = threading.Thread(target=run_discovery, name='discovery', daemon=True)
+        _discovery_thread.start()
 
     return jsonify({'success': True, 'message': 'Started company discovery'})
 
@@ -463,14 +787,25 @@ def get_discovery_status():
 @app.route('/api/companies')
 def get_discovered_companies():
     """Get all discovered companies"""
+    # The file is already JSON, so serve its bytes without a decode/encode
+    # round trip; anything that isn't a JSON object gets the default instead
+    try:
+        with open(DISCOVERED_FILE, 'rb') as f:
+            data = f.read().strip()
+    except OSError:
+        data = b''
+    if data.startswith(b'{') and data.endswith(b'}'):
+        return app.response_class(data, mimetype='application/json')
+
     default = {
         'greenhouse': {}, 'lever': {}, 'ashby': {},
         'smartrecruiters': {}, 'bamboohr': {}, 'last_updated': None
     }
-    return jsonify(load_json_file(DISCOVERED_FILE, default))
+    return jsonify(default)
 
 
-init_db()
+with app.app_context():
+    init_db()
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=False)
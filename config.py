@@ -2,20 +2,25 @@
 Shared configuration and utility functions for the job board application.
 """
 
-import json
 import os
+import orjson
 import re
-from typing import Dict, List
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.environ.get('DATA_DIR', os.path.join(SCRIPT_DIR, 'data'))
 COMPANIES_FILE = os.path.join(SCRIPT_DIR, 'companies.json')
 DISCOVERED_FILE = os.path.join(DATA_DIR, 'discovered_companies.json')
+DISCOVERED_COUNTS_FILE = os.path.join(DATA_DIR, 'discovered_counts.json')
 KEYWORDS_FILE = os.path.join(DATA_DIR, 'keywords.json')
 LOCATIONS_FILE = os.path.join(DATA_DIR, 'locations.json')
 DB_PATH = os.path.join(DATA_DIR, 'applications.db')
 JOBS_FILE = os.path.join(DATA_DIR, 'devops_jobs.json')
+HTTP_CACHE_FILE = os.path.join(DATA_DIR, 'http_cache.json')
 
 # Default keywords for job matching
 DEFAULT_KEYWORDS = [
@@ -32,6 +37,9 @@ DEFAULT_LOCATIONS = {
     ]
 }
 
+# Parsed JSON files keyed by path, reused until the file's mtime/size changes
+_json_cache: Dict[str, Tuple] = {}
+
 
 def ensure_data_dir():
     """Ensure the data directory exists"""
@@ -42,18 +50,81 @@ def load_json_file(filepath: str, default=None):
     """Load a JSON file with error handling"""
     if os.path.exists(filepath):
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
             pass
     return default if default is not None else {}
 
 
-def save_json_file(filepath: str, data, indent: int = 2):
-    """Save data to a JSON file"""
+def load_json_file_cached(filepath: str, default=None):
+    """
+    Load a JSON file, reusing the parsed result until the file changes.
+    Callers must treat the returned data as read-only.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return default if default is not None else {}
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(filepath)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    data = load_json_file(filepath, default)
+    _json_cache[filepath] = (stamp, data)
+    return data
+
+
+# Read once at import; os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _new_file_mode(filepath: str) -> int:
+    """Get the permissions a rewritten file should keep: its current ones, or the umask default"""
+    try:
+        return os.stat(filepath).st_mode & 0o777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_write(filepath: str, buffering: int = -1):
+    """
+    Open a binary temp file next to filepath and swap it into place on success,
+    so readers never see a partial file. The data is fsynced before the swap,
+    so a power loss can't leave an empty file either. The temp file is removed
+    on error.
+    """
+    with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(filepath), suffix='.tmp',
+                                     buffering=buffering, delete=False) as f:
+        tmp_path = f.name
+        try:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        # NamedTemporaryFile creates files as 0600
+        os.chmod(tmp_path, _new_file_mode(filepath))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_json_file(filepath: str, data, indent: bool = True):
+    """Save data to a JSON file, atomically replacing any existing file"""
     ensure_data_dir()
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=indent)
+    option = orjson.OPT_INDENT_2 if indent else 0
+    with atomic_write(filepath) as f:
+        f.write(orjson.dumps(data, option=option))
+    _json_cache.pop(filepath, None)
 
 
 def load_companies() -> Dict:
@@ -68,7 +139,7 @@ def load_discovered_companies() -> Dict:
 
 def load_keywords() -> List[str]:
     """Load search keywords from file"""
-    keywords = load_json_file(KEYWORDS_FILE)
+    keywords = load_json_file_cached(KEYWORDS_FILE)
     if keywords and isinstance(keywords, list):
         return keywords
     return DEFAULT_KEYWORDS.copy()
@@ -76,18 +147,18 @@ def load_keywords() -> List[str]:
 
 def save_keywords(keywords: List[str]):
     """Save search keywords to file"""
-    save_json_file(KEYWORDS_FILE, keywords, indent=None)
+    save_json_file(KEYWORDS_FILE, keywords, indent=False)
 
 
 def load_locations() -> Dict:
     """Load location filters from file or companies.json"""
     # First check for custom locations file
-    data = load_json_file(LOCATIONS_FILE)
+    data = load_json_file_cached(LOCATIONS_FILE)
     if data and isinstance(data, dict) and 'allowed' in data:
         return {'allowed': data['allowed']}
 
     # Fall back to companies.json locations
-    companies = load_companies()
+    companies = load_json_file_cached(COMPANIES_FILE, {})
     if 'locations' in companies:
         return {'allowed': companies['locations'].get('allowed', [])}
 
@@ -96,7 +167,28 @@ def load_locations() -> Dict:
 
 def save_locations(locations: Dict):
     """Save location filters to file"""
-    save_json_file(LOCATIONS_FILE, locations)
+    save_json_file(LOCATIONS_FILE, locations, indent=False)
+
+
+@lru_cache(maxsize=32)
+def compile_location_pattern(terms: Tuple[str, ...]) -> re.Pattern:
+    """Compile location terms into a single word-boundary alternation regex"""
+    if not terms:
+        return re.compile(r'(?!)')  # Never matches
+
+    # Duplicate terms (e.g. 'USA' and 'usa') only add dead branches to try
+    unique_terms = dict.fromkeys(t.lower() for t in terms)
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, unique_terms)) + r')\b')
+
+
+@lru_cache(maxsize=32)
+def compile_keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into a single alternation regex matching them as substrings"""
+    if not keywords:
+        return re.compile(r'(?!)')  # Never matches
+
+    unique_keywords = dict.fromkeys(kw.lower() for kw in keywords)
+    return re.compile('|'.join(map(re.escape, unique_keywords)))
 
 
 def matches_location_word_boundary(text: str, allowed_locations: List[str] = None) -> bool:
@@ -107,11 +199,5 @@ def matches_location_word_boundary(text: str, allowed_locations: List[str] = Non
     if allowed_locations is None:
         allowed_locations = DEFAULT_LOCATIONS['allowed']
 
-    text_lower = text.lower()
-
-    for term in allowed_locations:
-        pattern = r'\b' + re.escape(term.lower()) + r'\b'
-        if re.search(pattern, text_lower):
-            return True
-
-    return False
+    pattern = compile_location_pattern(tuple(allowed_locations))
+    return pattern.search(text.lower()) is not None
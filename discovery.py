@@ -5,7 +5,8 @@ This module is designed to be called from the web application only.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import os
 import time
 import random
@@ -14,6 +15,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from config import atomic_write
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -23,6 +26,11 @@ logger = logging.getLogger(__name__)
 # File to store discovered companies
 DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(__file__), 'data'))
 DISCOVERED_COMPANIES_FILE = os.path.join(DATA_DIR, 'discovered_companies.json')
+# Small sidecar with per-ATS counts so the web UI doesn't parse the full list
+DISCOVERED_COUNTS_FILE = os.path.join(DATA_DIR, 'discovered_counts.json')
+
+# Concurrent board checks when discovering in parallel
+DISCOVERY_WORKERS = 20
 
 # Large curated lists of companies by ATS
 # These are verified to use these ATS systems
@@ -1362,6 +1370,11 @@ class CompanyDiscovery:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Keep a keep-alive connection per worker for each ATS host; the
+        # default pool of 10 would discard and re-handshake the rest
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=DISCOVERY_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.discovered: Dict[str, Dict] = self._load_discovered()
 
     def _load_discovered(self) -> Dict:
@@ -1369,8 +1382,8 @@ class CompanyDiscovery:
         os.makedirs(DATA_DIR, exist_ok=True)
         if os.path.exists(DISCOVERED_COMPANIES_FILE):
             try:
-                with open(DISCOVERED_COMPANIES_FILE, 'r') as f:
-                    return json.load(f)
+                with open(DISCOVERED_COMPANIES_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
             except:
                 pass
         return {
@@ -1386,8 +1399,12 @@ class CompanyDiscovery:
         """Save discovered companies to file"""
         self.discovered['last_updated'] = datetime.now().isoformat()
         os.makedirs(DATA_DIR, exist_ok=True)
-        with open(DISCOVERED_COMPANIES_FILE, 'w') as f:
-            json.dump(self.discovered, f, indent=2)
+        # Written atomically so the web app never reads a partial file
+        with atomic_write(DISCOVERED_COMPANIES_FILE) as f:
+            f.write(orjson.dumps(self.discovered, option=orjson.OPT_INDENT_2))
+        # Written after the full list so its mtime marks it as up to date
+        with atomic_write(DISCOVERED_COUNTS_FILE) as f:
+            f.write(orjson.dumps(self.get_stats()))
 
     def _check_greenhouse(self, board_id: str) -> bool:
         """Check if a Greenhouse board exists"""
@@ -1430,7 +1447,7 @@ class CompanyDiscovery:
         try:
             url = f"https://{subdomain}.bamboohr.com/jobs/"
             response = self.session.get(url, timeout=10)
-            return response.status_code == 200 and 'job' in response.text.lower()
+            return response.status_code == 200 and b'job' in response.content.lower()
         except:
             return False
 
@@ -1479,7 +1496,7 @@ class CompanyDiscovery:
             return None
 
         if parallel:
-            with ThreadPoolExecutor(max_workers=20) as executor:
+            with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
                 futures = {executor.submit(check_company, item): item for item in all_checks}
                 for future in as_completed(futures):
                     result = future.result()
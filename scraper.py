@@ -4,19 +4,20 @@ Finds DevOps jobs in US/Canada from multiple sources.
 This module is designed to be called from the web application only.
 """
 
-import json
 import os
+import orjson
 import logging
-from typing import List
-from dataclasses import asdict
+from collections import Counter
+from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
 
 from config import (
-    DATA_DIR, load_companies, load_discovered_companies,
-    load_keywords, load_locations, ensure_data_dir
+    DATA_DIR, HTTP_CACHE_FILE, load_companies, load_discovered_companies,
+    load_keywords, load_locations, ensure_data_dir, load_json_file, atomic_write
 )
 from scrapers import (
     Job, GreenhouseScraper, LeverScraper, AshbyScraper,
-    RemotiveScraper, LinkedInScraper
+    RemotiveScraper, LinkedInScraper, ResponseCache
 )
 
 # Setup logging
@@ -27,44 +28,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def deduplicate_jobs(jobs: List[Job]) -> List[Job]:
-    """Remove duplicate job listings"""
-    seen = set()
-    unique_jobs = []
-
-    for job in jobs:
-        key = (job.title.lower().strip(), job.company.lower().strip())
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
-
-    return unique_jobs
+def job_key(title: str, company: str) -> tuple:
+    """Key used to treat two postings as the same job"""
+    return (title.lower().strip(), company.lower().strip())
 
 
 def save_jobs(jobs: List[Job], output_path: str):
     """Save jobs to JSON file"""
     ensure_data_dir()
 
-    # Load existing jobs and merge
+    # Load existing jobs as plain dicts; they're written back unchanged
     existing_jobs = []
+    loaded = False
     json_path = f"{output_path}.json"
     if os.path.exists(json_path):
         try:
-            with open(json_path, 'r') as f:
-                existing_data = json.load(f)
-                existing_jobs = [Job(**j) for j in existing_data]
-        except:
+            with open(json_path, 'rb') as f:
+                existing_jobs = orjson.loads(f.read())
+            loaded = True
+        except (orjson.JSONDecodeError, IOError):
             pass
 
-    # Merge and deduplicate
-    all_jobs = existing_jobs + jobs
-    unique_jobs = deduplicate_jobs(all_jobs)
-
-    # Save JSON
-    with open(json_path, 'w') as f:
-        json.dump([asdict(job) for job in unique_jobs], f, indent=2)
-
-    logger.info(f"Saved {len(unique_jobs)} jobs to {json_path}")
+    # Merge and deduplicate, keeping the first copy of each job; new jobs
+    # stay as Job objects, which orjson serializes directly
+    merged = {}
+    for job in existing_jobs:
+        merged.setdefault(job_key(job.get('title', ''), job.get('company', '')), job)
+    added = 0
+    for job in jobs:
+        key = job_key(job.title, job.company)
+        if key not in merged:
+            merged[key] = job
+            added += 1
+
+    # Leave the file alone when nothing is new, so readers' caches stay
+    # valid; a file that failed to load is always rewritten
+    if loaded and not added and len(merged) == len(existing_jobs):
+        logger.info(f"No new jobs; {json_path} is unchanged")
+        return
+
+    # Written atomically so a crash can't truncate the jobs file; jobs are
+    # serialized one at a time rather than as one large buffer
+    with atomic_write(json_path, buffering=1 << 20) as f:
+        f.write(b'[')
+        for i, job in enumerate(merged.values()):
+            if i:
+                f.write(b',')
+            f.write(orjson.dumps(job))
+        f.write(b']')
+
+    logger.info(f"Saved {len(merged)} jobs to {json_path}")
 
 
 def print_summary(jobs: List[Job]):
@@ -73,13 +86,9 @@ def print_summary(jobs: List[Job]):
     print(f"FOUND {len(jobs)} MATCHING JOBS")
     print("=" * 60)
 
-    by_source = {}
-    for job in jobs:
-        source = job.source.split('-')[0]
-        by_source.setdefault(source, []).append(job)
-
-    for source, source_jobs in sorted(by_source.items()):
-        print(f"\n{source}: {len(source_jobs)} jobs")
+    counts = Counter(job.source.partition('-')[0] for job in jobs)
+    for source, count in sorted(counts.items()):
+        print(f"\n{source}: {count} jobs")
 
     print("=" * 60)
 
@@ -113,15 +122,25 @@ def run_scraper(keywords=None, output_path=None, parallel=True, workers=10):
     logger.info(f"Keywords: {keywords}")
     logger.info(f"Allowed locations: {len(locations.get('allowed', []))} terms")
 
+    # ATS postings from the last run, revalidated with conditional requests
+    http_cache = ResponseCache(load_json_file(HTTP_CACHE_FILE, {}), keywords)
+
+    # One pool for every ATS board in the run, sized so each of the three
+    # ATS scrapers still gets its share of workers
+    company_pool = ThreadPoolExecutor(max_workers=workers * 3, thread_name_prefix='company')
+
     # Scraper configuration
     config = {
         'parallel_mode': parallel,
         'max_workers': workers,
         'keywords': keywords,
-        'allowed_locations': locations.get('allowed', [])
+        'allowed_locations': locations.get('allowed', []),
+        'http_cache': http_cache,
+        'executor': company_pool,
     }
 
-    all_jobs: List[Job] = []
+    # Jobs keyed by job_key, deduplicated as each scraper's results come in
+    found_jobs: Dict[tuple, Job] = {}
 
     # Merge companies from companies.json and discovered
     greenhouse_companies = {}
@@ -145,18 +164,29 @@ def run_scraper(keywords=None, output_path=None, parallel=True, workers=10):
         ('LinkedIn', LinkedInScraper(config)),
     ]
 
-    # Run scrapers
-    for name, scraper in scrapers:
-        try:
+    # Run scrapers concurrently, since each one is mostly waiting on the
+    # network; results are collected in the order above so deduplication
+    # keeps the same copy of a job regardless of which scraper finishes first
+    with company_pool, ThreadPoolExecutor(max_workers=len(scrapers) if parallel else 1) as executor:
+        futures = []
+        for name, scraper in scrapers:
             logger.info(f"Running {name}...")
-            jobs = scraper.scrape()
-            all_jobs.extend(jobs)
-            logger.info(f"{name}: Found {len(jobs)} jobs")
-        except Exception as e:
-            logger.error(f"Error running {name}: {e}")
-
-    # Deduplicate and save
-    unique_jobs = deduplicate_jobs(all_jobs)
+            futures.append((name, executor.submit(scraper.scrape)))
+
+        for name, future in futures:
+            try:
+                jobs = future.result()
+                for job in jobs:
+                    found_jobs.setdefault(job_key(job.title, job.company), job)
+                logger.info(f"{name}: Found {len(jobs)} jobs")
+            except Exception as e:
+                logger.error(f"Error running {name}: {e}")
+
+    ensure_data_dir()
+    with atomic_write(HTTP_CACHE_FILE) as f:
+        http_cache.write(f)
+
+    unique_jobs = list(found_jobs.values())
     logger.info(f"Total unique jobs: {len(unique_jobs)}")
 
     save_jobs(unique_jobs, output_path)
@@ -3,23 +3,80 @@ Job Scraper Classes
 Individual scraper implementations for different job sources and ATS systems.
 """
 
+import atexit
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import orjson
 import re
 import time
+from html.parser import HTMLParser
 import random
 import logging
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from urllib.parse import quote, urlsplit
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from itertools import chain
 
-from config import DEFAULT_KEYWORDS, matches_location_word_boundary
+from config import (
+    DEFAULT_KEYWORDS, DEFAULT_LOCATIONS, compile_keyword_pattern, compile_location_pattern
+)
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# (connect, read) timeouts: an unreachable board fails fast instead of
+# holding a worker thread for the full read timeout on every retry
+REQUEST_TIMEOUT = (5, 30)
+
+# Requests per second allowed to any one host, across all scrapers
+HOST_REQUESTS_PER_SECOND = 20
+# Lower rates for hosts that throttle scrapers
+HOST_RATE_OVERRIDES = {
+    'www.linkedin.com': 0.3,
+    'remotive.com': 1.5,
+}
+
+# Salary formats, most specific first
+SALARY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\$[\d,]+\s*[-–]\s*\$[\d,]+',
+        r'\$[\d,]+k?\s*[-–]\s*\$?[\d,]+k?',
+        r'CAD\s*[\d,]+\s*[-–]\s*[\d,]+',
+        r'USD\s*[\d,]+\s*[-–]\s*[\d,]+',
+        r'\$[\d,]+\+?',
+    )
+]
+
+# LinkedIn job card class names
+LINKEDIN_CARD_CLASS = re.compile(r'base-card|job-search-card')
+LINKEDIN_TITLE_CLASS = re.compile(r'title|job-title')
+LINKEDIN_COMPANY_CLASS = re.compile(r'company|subtitle')
+LINKEDIN_LOCATION_CLASS = re.compile(r'location')
+LINKEDIN_LINK_CLASS = re.compile(r'base-card__full-link')
+# Only the job cards of a search page are parsed into a tree
+LINKEDIN_CARDS_ONLY = SoupStrainer('div', class_=LINKEDIN_CARD_CLASS)
+
+# Common location terms mapped to LinkedIn's location format
+LINKEDIN_LOCATIONS = {
+    'usa': 'United States',
+    'united states': 'United States',
+    'u.s.': 'United States',
+    'america': 'United States',
+    'canada': 'Canada',
+    'north america': 'United States',
+    'remote': 'Worldwide',
+    'worldwide': 'Worldwide',
+    'global': 'Worldwide',
+    'anywhere': 'Worldwide',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Job:
     """Represents a job posting"""
     title: str
@@ -33,22 +90,164 @@ class Job:
     date_scraped: str
 
 
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections and retries.
+    Scrapers use the shared module-level session unless given their own.
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+    })
+    # Retries are re-sent inside the adapter, so they bypass the per-host
+    # RateLimiter. 429 is not retried: safe_get sees the throttle and that
+    # request is given up. Retry-After on a 503 is ignored so a server can't
+    # stall a worker for as long as it asks; backoff stays under ~1.2 s.
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                    respect_retry_after_header=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size * 4,
+                          max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class RateLimiter:
+    """
+    Thread-safe per-host leaky bucket. Requests to the same host are spaced
+    at least 1/rate seconds apart in the order they ask, using the host's
+    entry in host_rates if it has one; other hosts' requests are not held up.
+    """
+
+    def __init__(self, rate: float, host_rates: Dict[str, float] = None):
+        self.interval = 1.0 / rate
+        self.host_intervals = {host: 1.0 / r for host, r in (host_rates or {}).items()}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Block until a request to the URL's host may be sent"""
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.host_intervals.get(host, self.interval)
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ResponseCache:
+    """
+    What scrapers keep from JSON API responses, with the responses'
+    ETag/Last-Modified validators. Scrapers may drop postings that don't
+    match the keywords before caching, so the saved entries are only reused
+    by a run with the same keywords. `entries` holds only the URLs fetched
+    in this run, so boards that are no longer scraped drop out.
+    """
+
+    def __init__(self, saved: Dict = None, keywords: List[str] = None):
+        self.keywords = list(keywords or [])
+        saved = saved or {}
+        self.previous: Dict[str, Dict] = (
+            saved.get('entries', {}) if saved.get('keywords') == self.keywords else {}
+        )
+        self.entries: Dict[str, Dict] = {}
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        return self.previous.get(url)
+
+    def store(self, url: str, entry: Dict):
+        self.entries[url] = entry
+
+    def write(self, f):
+        """Write the keywords and this run's entries to a binary file as JSON, one entry at a time"""
+        f.write(b'{"keywords":')
+        f.write(orjson.dumps(self.keywords))
+        f.write(b',"entries":{')
+        for i, (url, entry) in enumerate(self.entries.items()):
+            if i:
+                f.write(b',')
+            f.write(orjson.dumps(url))
+            f.write(b':')
+            f.write(orjson.dumps(entry))
+        f.write(b'}}')
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the text of an HTML document, skipping scripts and styles"""
+
+    SKIP_TAGS = {'script', 'style', 'template'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.length = 0
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+            self.length += len(data)
+
+    def unknown_decl(self, data):
+        if data.startswith('CDATA['):
+            self.handle_data(data[6:])
+
+
+def html_to_text(html: str, limit: int, chunk_size: int = 2048) -> str:
+    """
+    Get up to `limit` characters of an HTML fragment's text. Parses in chunks
+    and stops once enough text is collected, instead of building a full tree.
+    """
+    parser = _TextExtractor()
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        if parser.length >= limit:
+            break
+    else:
+        parser.close()
+    return ''.join(parser.parts)[:limit]
+
+
+# One connection pool shared by every scraper, so TCP/TLS connections to
+# each API host are reused across scrapers and across runs
+_SHARED_SESSION = create_session(pool_size=25)
+atexit.register(_SHARED_SESSION.close)
+_RATE_LIMITER = RateLimiter(HOST_REQUESTS_PER_SECOND, HOST_RATE_OVERRIDES)
+
+
 class JobScraper:
     """Base scraper class with common functionality"""
 
     def __init__(self, config: Dict = None):
         self.config = config or {}
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
+        self.session = self.config.get('session') or _SHARED_SESSION
+        self.rate_limiter = self.config.get('rate_limiter') or _RATE_LIMITER
         self.jobs: List[Job] = []
         self.parallel_mode = config.get('parallel_mode', False) if config else False
         self.max_workers = config.get('max_workers', 10) if config else 10
         self.keywords = config.get('keywords', []) if config else []
         self.allowed_locations = config.get('allowed_locations', []) if config else []
+        self.location_pattern = compile_location_pattern(
+            tuple(self.allowed_locations or DEFAULT_LOCATIONS['allowed'])
+        )
+        # Lowercased location -> allowed; the same few locations recur constantly
+        self._location_matches: Dict[str, bool] = {}
+        # Compiled once per run: every scraper shares the same keywords
+        self.keyword_pattern = compile_keyword_pattern(tuple(self.keywords or DEFAULT_KEYWORDS))
+        self.http_cache: Optional[ResponseCache] = self.config.get('http_cache')
+        # Timestamp stamped on every job found in a scrape pass
+        self.scraped_at = datetime.now().isoformat()
 
     def random_delay(self, min_sec=1, max_sec=3):
         """Random delay to avoid rate limiting"""
@@ -60,37 +259,75 @@ class JobScraper:
     def safe_get(self, url: str, **kwargs) -> Optional[requests.Response]:
         """Safe GET request with error handling"""
         try:
-            response = self.session.get(url, timeout=30, **kwargs)
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
             logger.debug(f"Error fetching {url}: {e}")
             return None
 
+    def get_json(self, url: str, extract: Callable = None):
+        """
+        GET and decode a JSON API response, or None on failure. extract, if
+        given, reduces the decoded data to what the scraper reads, and its
+        result is returned and cached instead. With an HTTP cache configured,
+        sends the last run's validators and reuses its data when the server
+        answers 304 Not Modified.
+        """
+        cached = self.http_cache.lookup(url) if self.http_cache else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.safe_get(url, headers=headers)
+        if not response:
+            return None
+        if response.status_code == 304 and cached:
+            self.http_cache.store(url, cached)
+            return cached['extracted']
+
+        data = orjson.loads(response.content)
+        if extract is not None:
+            data = extract(data)
+        if self.http_cache is not None:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.http_cache.store(url, {'etag': etag, 'last_modified': last_modified,
+                                            'extracted': data})
+        return data
+
     def extract_salary(self, text: str) -> str:
         """Extract salary information from text"""
-        patterns = [
-            r'\$[\d,]+\s*[-–]\s*\$[\d,]+',
-            r'\$[\d,]+k?\s*[-–]\s*\$?[\d,]+k?',
-            r'CAD\s*[\d,]+\s*[-–]\s*[\d,]+',
-            r'USD\s*[\d,]+\s*[-–]\s*[\d,]+',
-            r'\$[\d,]+\+?',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in SALARY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group()
         return "Not specified"
 
     def matches_keywords(self, title: str, description: str = "") -> bool:
         """Check if job matches configured keywords"""
-        keywords = self.keywords if self.keywords else DEFAULT_KEYWORDS
-        text = f"{title} {description}".lower()
-        return any(kw.lower() in text for kw in keywords)
+        text = f"{title} {description}" if description else title
+        return self.keyword_pattern.search(text.lower()) is not None
 
     def matches_location(self, location: str, description: str = "") -> bool:
         """Check if job location is allowed using word boundary matching"""
-        return matches_location_word_boundary(location, self.allowed_locations or None)
+        return self.matches_location_lower(location.lower() if location else '')
+
+    def matches_location_lower(self, location_lower: str) -> bool:
+        """Like matches_location, for a location that is already lowercased"""
+        # Every location term needs a word to match, so blank locations never do
+        if not location_lower:
+            return False
+        matched = self._location_matches.get(location_lower)
+        if matched is None:
+            matched = self.location_pattern.search(location_lower) is not None
+            self._location_matches[location_lower] = matched
+        return matched
 
     def scrape_companies(self, companies: Dict, scrape_func) -> List[Job]:
         """
@@ -100,215 +337,198 @@ class JobScraper:
             companies: Dict of company_name -> board_id
             scrape_func: Function that takes (company_name, board_id) and returns List[Job]
         """
-        if self.parallel_mode:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(scrape_func, name, board_id): name
-                    for name, board_id in companies.items()
-                }
-                for future in as_completed(futures):
-                    try:
-                        self.jobs.extend(future.result())
-                    except Exception as e:
-                        logger.debug(f"Error in parallel scrape: {e}")
-        else:
+        self.scraped_at = datetime.now().isoformat()
+        if not self.parallel_mode:
             for company_name, board_id in companies.items():
                 self.jobs.extend(scrape_func(company_name, board_id))
+            return self.jobs
 
-        return self.jobs
-
-
-class GreenhouseScraper(JobScraper):
-    """Scraper for Greenhouse ATS boards"""
-
-    def __init__(self, config: Dict = None, companies: Dict = None):
-        super().__init__(config)
-        self.companies = companies or {}
-
-    def _scrape_company(self, company_name: str, board_id: str) -> List[Job]:
-        """Scrape a single Greenhouse company board"""
-        jobs = []
+        # Use the run's shared company pool when given one
+        executor = self.config.get('executor')
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
         try:
-            api_url = f"https://boards-api.greenhouse.io/v1/boards/{board_id}/jobs"
-            response = self.safe_get(api_url)
-            if not response:
-                return jobs
-
-            data = response.json()
+            results = executor.map(partial(self._scrape_one, scrape_func), companies.items())
+            self.jobs.extend(chain.from_iterable(results))
+        finally:
+            if own_executor:
+                executor.shutdown()
 
-            for job_data in data.get('jobs', []):
-                title = job_data.get('title', '')
+        return self.jobs
 
-                if not self.matches_keywords(title):
-                    continue
+    @staticmethod
+    def _scrape_one(scrape_func, company) -> List[Job]:
+        """Scrape one (company_name, board_id) pair, logging any error"""
+        try:
+            return scrape_func(*company)
+        except Exception as e:
+            logger.debug(f"Error in parallel scrape: {e}")
+            return []
 
-                location = job_data.get('location', {}).get('name', 'Remote')
 
-                if not self.matches_location(location):
-                    continue
+class ATSScraper(JobScraper):
+    """
+    Base scraper for ATS job board APIs that list one company's postings per
+    request. Subclasses set the API details and how to read posting fields.
+    """
 
-                job = Job(
-                    title=title,
-                    company=company_name,
-                    location=location,
-                    salary="Not specified",
-                    url=job_data.get('absolute_url', ''),
-                    source=f"Greenhouse-{company_name}",
-                    description="",
-                    remote='remote' in location.lower(),
-                    date_scraped=datetime.now().isoformat()
-                )
-                jobs.append(job)
-                logger.info(f"Found Greenhouse {company_name}: {title}")
+    name = ''
+    # API URL with a {board_id} placeholder
+    api_url = ''
+    title_field = 'title'
 
-            self.random_delay(0.5, 1)
-        except Exception as e:
-            logger.debug(f"Error scraping Greenhouse {company_name}: {e}")
+    def __init__(self, config: Dict = None, companies: Dict = None):
+        super().__init__(config)
+        self.companies = companies or {}
 
-        return jobs
+    def get_postings(self, data) -> List[Dict]:
+        """Get the postings from a decoded API response"""
+        return data.get('jobs', [])
 
-    def scrape(self) -> List[Job]:
-        logger.info(f"Scraping {len(self.companies)} Greenhouse boards...")
-        self.scrape_companies(self.companies, self._scrape_company)
-        logger.info(f"GreenhouseScraper: Found {len(self.jobs)} jobs")
-        return self.jobs
+    def get_location(self, job_data: Dict):
+        """Get a posting's location"""
+        return job_data.get('location', 'Remote')
 
+    def get_url(self, job_data: Dict) -> str:
+        """Get a posting's URL"""
+        return job_data.get('absolute_url', '')
 
-class LeverScraper(JobScraper):
-    """Scraper for Lever ATS boards"""
+    def get_description(self, job_data: Dict) -> str:
+        """Get the start of a posting's plain text description"""
+        return (job_data.get('descriptionPlain') or '')[:500]
 
-    def __init__(self, config: Dict = None, companies: Dict = None):
-        super().__init__(config)
-        self.companies = companies or {}
+    def extract_postings(self, data) -> List[Tuple[str, str, str, str]]:
+        """
+        Reduce a decoded API response to (title, location, url, description)
+        for each posting matching the keywords, so the HTTP cache doesn't
+        keep full posting bodies
+        """
+        postings = []
+        for job_data in self.get_postings(data):
+            title = job_data.get(self.title_field, '')
+            if self.matches_keywords(title):
+                postings.append((title, str(self.get_location(job_data)),
+                                 self.get_url(job_data), self.get_description(job_data)))
+        return postings
 
     def _scrape_company(self, company_name: str, board_id: str) -> List[Job]:
-        """Scrape a single Lever company board"""
+        """Scrape a single company board"""
         jobs = []
         try:
-            api_url = f"https://api.lever.co/v0/postings/{board_id}"
-            response = self.safe_get(api_url)
-            if not response:
+            postings = self.get_json(self.api_url.format(board_id=board_id), self.extract_postings)
+            if postings is None:
                 return jobs
 
-            jobs_data = response.json()
-
-            for job_data in jobs_data:
-                title = job_data.get('text', '')
+            for title, location, url, description in postings:
+                location_lower = location.lower()
 
-                if not self.matches_keywords(title):
-                    continue
-
-                location = job_data.get('categories', {}).get('location', 'Remote')
-
-                if not self.matches_location(str(location)):
+                if not self.matches_location_lower(location_lower):
                     continue
 
                 job = Job(
                     title=title,
                     company=company_name,
-                    location=location or 'Remote',
+                    location=location,
                     salary="Not specified",
-                    url=job_data.get('hostedUrl', ''),
-                    source=f"Lever-{company_name}",
-                    description=job_data.get('descriptionPlain', '')[:500] if job_data.get('descriptionPlain') else '',
-                    remote='remote' in str(location).lower(),
-                    date_scraped=datetime.now().isoformat()
+                    url=url,
+                    source=f"{self.name}-{company_name}",
+                    description=description,
+                    remote='remote' in location_lower,
+                    date_scraped=self.scraped_at
                 )
                 jobs.append(job)
-                logger.info(f"Found Lever {company_name}: {title}")
-
-            self.random_delay(0.5, 1)
+                logger.info(f"Found {self.name} {company_name}: {title}")
         except Exception as e:
-            logger.debug(f"Error scraping Lever {company_name}: {e}")
+            logger.debug(f"Error scraping {self.name} {company_name}: {e}")
 
         return jobs
 
     def scrape(self) -> List[Job]:
-        logger.info(f"Scraping {len(self.companies)} Lever boards...")
+        logger.info(f"Scraping {len(self.companies)} {self.name} boards...")
         self.scrape_companies(self.companies, self._scrape_company)
-        logger.info(f"LeverScraper: Found {len(self.jobs)} jobs")
+        logger.info(f"{type(self).__name__}: Found {len(self.jobs)} jobs")
         return self.jobs
 
 
-class AshbyScraper(JobScraper):
-    """Scraper for Ashby ATS boards"""
+class GreenhouseScraper(ATSScraper):
+    """Scraper for Greenhouse ATS boards"""
 
-    def __init__(self, config: Dict = None, companies: Dict = None):
-        super().__init__(config)
-        self.companies = companies or {}
+    name = 'Greenhouse'
+    api_url = "https://boards-api.greenhouse.io/v1/boards/{board_id}/jobs"
 
-    def _scrape_company(self, company_name: str, board_id: str) -> List[Job]:
-        """Scrape a single Ashby company board"""
-        jobs = []
-        try:
-            api_url = f"https://api.ashbyhq.com/posting-api/job-board/{board_id}"
-            response = self.safe_get(api_url)
-            if not response:
-                return jobs
+    def get_location(self, job_data: Dict):
+        return job_data.get('location', {}).get('name', 'Remote')
 
-            data = response.json()
 
-            for job_data in data.get('jobs', []):
-                title = job_data.get('title', '')
+class LeverScraper(ATSScraper):
+    """Scraper for Lever ATS boards"""
 
-                if not self.matches_keywords(title):
-                    continue
+    name = 'Lever'
+    api_url = "https://api.lever.co/v0/postings/{board_id}"
+    title_field = 'text'
 
-                location = job_data.get('location', 'Remote')
-                if isinstance(location, dict):
-                    location = location.get('name', 'Remote')
+    def get_postings(self, data) -> List[Dict]:
+        return data
 
-                if not self.matches_location(str(location)):
-                    continue
+    def get_location(self, job_data: Dict):
+        return job_data.get('categories', {}).get('location', 'Remote')
 
-                job = Job(
-                    title=title,
-                    company=company_name,
-                    location=str(location),
-                    salary="Not specified",
-                    url=job_data.get('jobUrl', job_data.get('applyUrl', '')),
-                    source=f"Ashby-{company_name}",
-                    description=job_data.get('descriptionPlain', '')[:500] if job_data.get('descriptionPlain') else '',
-                    remote='remote' in str(location).lower(),
-                    date_scraped=datetime.now().isoformat()
-                )
-                jobs.append(job)
-                logger.info(f"Found Ashby {company_name}: {title}")
+    def get_url(self, job_data: Dict) -> str:
+        return job_data.get('hostedUrl', '')
 
-            self.random_delay(0.5, 1)
-        except Exception as e:
-            logger.debug(f"Error scraping Ashby {company_name}: {e}")
 
-        return jobs
+class AshbyScraper(ATSScraper):
+    """Scraper for Ashby ATS boards"""
 
-    def scrape(self) -> List[Job]:
-        logger.info(f"Scraping {len(self.companies)} Ashby boards...")
-        self.scrape_companies(self.companies, self._scrape_company)
-        logger.info(f"AshbyScraper: Found {len(self.jobs)} jobs")
-        return self.jobs
+    name = 'Ashby'
+    api_url = "https://api.ashbyhq.com/posting-api/job-board/{board_id}"
+
+    def get_location(self, job_data: Dict):
+        location = job_data.get('location', 'Remote')
+        if isinstance(location, dict):
+            location = location.get('name', 'Remote')
+        return location
+
+    def get_url(self, job_data: Dict) -> str:
+        return job_data.get('jobUrl') or job_data.get('applyUrl', '')
 
 
 class RemotiveScraper(JobScraper):
     """Scraper for Remotive.io - Remote job board"""
 
+    def _search(self, keyword: str) -> Optional[requests.Response]:
+        """Fetch Remotive search results for one keyword"""
+        # URL encode the keyword for the search parameter
+        encoded_keyword = keyword.replace(' ', '%20')
+        url = f"https://remotive.com/api/remote-jobs?search={encoded_keyword}"
+
+        # Spaced by the rate limiter's remotive.com rate, in either mode
+        return self.safe_get(url)
+
     def scrape(self) -> List[Job]:
         logger.info("Scraping Remotive...")
+        self.scraped_at = datetime.now().isoformat()
 
         # Use configured keywords for search, or defaults
         keywords = self.keywords if self.keywords else DEFAULT_KEYWORDS
         seen_urls = set()
 
-        for keyword in keywords:
-            # URL encode the keyword for the search parameter
-            encoded_keyword = keyword.replace(' ', '%20')
-            url = f"https://remotive.com/api/remote-jobs?search={encoded_keyword}"
+        # Searches are independent, so fetch them concurrently, still paced
+        # by the rate limiter; results are processed in keyword order so the
+        # same copy of a job is kept
+        if self.parallel_mode and len(keywords) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(keywords))) as executor:
+                responses = list(executor.map(self._search, keywords))
+        else:
+            responses = map(self._search, keywords)
 
-            response = self.safe_get(url)
+        for keyword, response in zip(keywords, responses):
             if not response:
                 continue
 
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 for job_data in data.get('jobs', [])[:20]:
                     job_url = job_data.get('url', '')
@@ -331,15 +551,13 @@ class RemotiveScraper(JobScraper):
                         salary=job_data.get('salary', 'Not specified'),
                         url=job_url,
                         source="Remotive",
-                        description=BeautifulSoup(job_data.get('description', ''), 'html.parser').get_text()[:500],
+                        description=html_to_text(job_data.get('description', ''), 500),
                         remote=True,
-                        date_scraped=datetime.now().isoformat()
+                        date_scraped=self.scraped_at
                     )
                     self.jobs.append(job)
                     logger.info(f"Found Remotive: {job.title} at {job.company}")
 
-                self.random_delay(0.5, 1)
-
             except Exception as e:
                 logger.error(f"Error parsing Remotive for keyword '{keyword}': {e}")
 
@@ -350,117 +568,115 @@ class RemotiveScraper(JobScraper):
 class LinkedInScraper(JobScraper):
     """Scraper for LinkedIn public job postings"""
 
-    def _build_search_urls(self) -> List[str]:
-        """Build LinkedIn search URLs from configured keywords and locations"""
+    @cached_property
+    def search_urls(self) -> List[str]:
+        """LinkedIn search URLs for the configured keywords and locations"""
         keywords = self.keywords if self.keywords else DEFAULT_KEYWORDS
 
-        # Map common location terms to LinkedIn location format
-        location_mapping = {
-            'usa': 'United States',
-            'united states': 'United States',
-            'u.s.': 'United States',
-            'america': 'United States',
-            'canada': 'Canada',
-            'north america': 'United States',
-            'remote': 'Worldwide',
-            'worldwide': 'Worldwide',
-            'global': 'Worldwide',
-            'anywhere': 'Worldwide',
-        }
-
-        # Get unique LinkedIn locations from configured locations
-        linkedin_locations = set()
+        # Get unique LinkedIn locations from configured locations, in order
+        linkedin_locations = {}
         for loc in self.allowed_locations:
-            loc_lower = loc.lower()
-            if loc_lower in location_mapping:
-                linkedin_locations.add(location_mapping[loc_lower])
-            else:
-                # Use the location as-is if not in mapping (capitalize words)
-                linkedin_locations.add(loc.title())
+            # Use the location as-is if not in mapping (capitalize words)
+            linkedin_locations.setdefault(LINKEDIN_LOCATIONS.get(loc.lower()) or loc.title())
 
         # Default to US and Canada if no locations configured
         if not linkedin_locations:
-            linkedin_locations = {'United States', 'Canada'}
+            linkedin_locations = dict.fromkeys(['United States', 'Canada'])
 
         # Build URLs for each keyword + location combination
         # Limit to first 3 keywords and 2 locations to avoid too many requests
         urls = []
         for keyword in keywords[:3]:
-            encoded_keyword = keyword.replace(' ', '%20')
+            encoded_keyword = quote(keyword, safe='')
             for location in list(linkedin_locations)[:2]:
-                encoded_location = location.replace(' ', '%20')
+                encoded_location = quote(location, safe='')
                 # f_WT=2 means remote jobs
                 url = f'https://www.linkedin.com/jobs/search/?keywords={encoded_keyword}&location={encoded_location}&f_WT=2'
                 urls.append(url)
 
         return urls
 
+    def _search(self, url: str) -> Optional[requests.Response]:
+        """Fetch one LinkedIn search results page"""
+        # Spaced by the rate limiter's low linkedin.com rate, in either mode
+        return self.safe_get(url)
+
+    def _parse_page(self, url: str, html: str, seen_urls: set):
+        """Add the matching job cards from one search results page"""
+        soup = BeautifulSoup(html, 'html.parser', parse_only=LINKEDIN_CARDS_ONLY)
+        job_cards = soup.find_all('div', class_=LINKEDIN_CARD_CLASS, limit=10)
+
+        for card in job_cards:
+            try:
+                title_elem = card.find(['h3', 'span'], class_=LINKEDIN_TITLE_CLASS)
+                company_elem = card.find(['h4', 'a'], class_=LINKEDIN_COMPANY_CLASS)
+                location_elem = card.find(['span'], class_=LINKEDIN_LOCATION_CLASS)
+                link_elem = card.find('a', class_=LINKEDIN_LINK_CLASS)
+
+                if not title_elem:
+                    continue
+
+                job_url = link_elem['href'] if link_elem else url
+
+                # Skip if we've already seen this job
+                if job_url in seen_urls:
+                    continue
+                seen_urls.add(job_url)
+
+                title = title_elem.get_text(strip=True)
+                company = company_elem.get_text(strip=True) if company_elem else "Unknown"
+                location = location_elem.get_text(strip=True) if location_elem else "Remote"
+                location_lower = location.lower()
+
+                if not self.matches_keywords(title):
+                    continue
+
+                if not self.matches_location_lower(location_lower):
+                    continue
+
+                job = Job(
+                    title=title,
+                    company=company,
+                    location=location,
+                    salary="Not specified",
+                    url=job_url,
+                    source="LinkedIn",
+                    description=card.get_text()[:500],
+                    remote='remote' in location_lower,
+                    date_scraped=self.scraped_at
+                )
+                self.jobs.append(job)
+                logger.info(f"Found LinkedIn: {title} at {company}")
+
+            except Exception as e:
+                logger.debug(f"Error parsing LinkedIn card: {e}")
+                continue
+
     def scrape(self) -> List[Job]:
         logger.info("Scraping LinkedIn...")
+        self.scraped_at = datetime.now().isoformat()
 
         # Build dynamic search URLs from keywords and locations
-        searches = self._build_search_urls()
+        searches = self.search_urls
         seen_urls = set()
 
-        for url in searches:
-            try:
-                response = self.safe_get(url)
-                if not response:
-                    continue
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all('div', class_=re.compile(r'base-card|job-search-card'))
-
-                for card in job_cards[:10]:
-                    try:
-                        title_elem = card.find(['h3', 'span'], class_=re.compile(r'title|job-title'))
-                        company_elem = card.find(['h4', 'a'], class_=re.compile(r'company|subtitle'))
-                        location_elem = card.find(['span'], class_=re.compile(r'location'))
-                        link_elem = card.find('a', class_=re.compile(r'base-card__full-link'))
-
-                        if not title_elem:
-                            continue
-
-                        job_url = link_elem['href'] if link_elem else url
-
-                        # Skip if we've already seen this job
-                        if job_url in seen_urls:
-                            continue
-                        seen_urls.add(job_url)
-
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-                        location = location_elem.get_text(strip=True) if location_elem else "Remote"
-
-                        if not self.matches_keywords(title):
-                            continue
-
-                        if not self.matches_location(location):
-                            continue
-
-                        job = Job(
-                            title=title,
-                            company=company,
-                            location=location,
-                            salary="Not specified",
-                            url=job_url,
-                            source="LinkedIn",
-                            description=card.get_text()[:500],
-                            remote='remote' in location.lower(),
-                            date_scraped=datetime.now().isoformat()
-                        )
-                        self.jobs.append(job)
-                        logger.info(f"Found LinkedIn: {title} at {company}")
-
-                    except Exception as e:
-                        logger.debug(f"Error parsing LinkedIn card: {e}")
-                        continue
+        # Fetch searches concurrently like Remotive, still paced by the rate
+        # limiter, and parse pages in search order so the same copy of a
+        # job is kept
+        if self.parallel_mode and len(searches) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(searches))) as executor:
+                responses = list(executor.map(self._search, searches))
+        else:
+            responses = map(self._search, searches)
 
-                self.random_delay(2, 4)
+        for url, response in zip(searches, responses):
+            if not response:
+                continue
 
+            try:
+                self._parse_page(url, response.text, seen_urls)
             except Exception as e:
                 logger.debug(f"Error scraping LinkedIn: {e}")
-                continue
 
         logger.info(f"LinkedInScraper: Found {len(self.jobs)} jobs")
         return self.jobs